@@ -0,0 +1,42 @@
+"""
+Optional acceleration backends.
+
+Numba is used when it is installed. Without it, `njit` is a no-op
+decorator and `prange` falls back to `range`, so compiled kernels still
+import; callers check HAVE_NUMBA and use their NumPy implementations
+instead of running kernels as plain Python.
+
+NumExpr, when installed, evaluates elementwise expressions over large
+arrays in one pass; callers check HAVE_NUMEXPR and the array size
+against NUMEXPR_MIN_SIZE, below which NumPy is faster.
+"""
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+try:
+    import numexpr
+
+    HAVE_NUMEXPR = True
+except ImportError:  # pragma: no cover - depends on the environment
+    numexpr = None
+    HAVE_NUMEXPR = False
+
+# Arrays at or below this size are cheaper to evaluate with plain NumPy
+NUMEXPR_MIN_SIZE = 1024
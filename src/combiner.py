@@ -3,9 +3,15 @@ Signal combination and confidence estimation.
 
 This module combines independent bias signals into a single
 probability surface, governed by preset aggressiveness.
+
+Signals are dense per-number arrays aligned on the same number range,
+so the combination is a single vector expression rather than a
+per-number loop.
 """
 
-from typing import Dict
+from typing import Tuple
+
+import numpy as np
 
 from src.config import (
     WEIGHT_SHORT_TERM,
@@ -14,23 +20,33 @@ from src.config import (
 )
 
 
-def _normalize(scores: Dict[int, float]) -> Dict[int, float]:
+# -------------------------
+# Preset multipliers
+# -------------------------
+PRESET_MULTIPLIERS = {
+    "conservative": {"dominance": 0.7, "randomness_damp": 0.5},
+    "balanced": {"dominance": 1.0, "randomness_damp": 1.0},
+    "aggressive": {"dominance": 1.4, "randomness_damp": 1.2},
+}
+
+
+def _normalize(scores: np.ndarray) -> np.ndarray:
     """
-    Normalize a score dict to the range [-1, 1].
+    Normalize a score array to the range [-1, 1].
     """
-    if not scores:
+    if scores.size == 0:
         return scores
 
-    max_abs = max(abs(v) for v in scores.values()) or 1.0
-    return {k: v / max_abs for k, v in scores.items()}
+    max_abs = np.max(np.abs(scores)) or 1.0
+    return scores / max_abs
 
 
 def combine_signals(
-    short_term: Dict[int, float],
-    long_term: Dict[int, float],
-    hot_cold: Dict[int, float],
+    short_term: np.ndarray,
+    long_term: np.ndarray,
+    hot_cold: np.ndarray,
     preset: str = "balanced",
-) -> Dict[int, Dict[str, float]]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Combine bias signals into a final score and confidence.
 
@@ -38,42 +54,39 @@ def combine_signals(
         - conservative
         - balanced
         - aggressive
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (scores, confidences), aligned
+        with the input signal arrays
     """
+    # Signals are combined positionally, so they must cover the same range
+    if not short_term.shape == long_term.shape == hot_cold.shape:
+        raise ValueError(
+            f"Signal shapes differ: short_term {short_term.shape}, "
+            f"long_term {long_term.shape}, hot_cold {hot_cold.shape}"
+        )
+
     short_term = _normalize(short_term)
     long_term = _normalize(long_term)
     hot_cold = _normalize(hot_cold)
 
-    combined = {}
-
-    # Preset multipliers
-    if preset == "conservative":
-        dominance = 0.7
-        randomness_damp = 0.5
-    elif preset == "aggressive":
-        dominance = 1.4
-        randomness_damp = 1.2
-    else:  # balanced
-        dominance = 1.0
-        randomness_damp = 1.0
-
-    for n in short_term:
-        raw_score = (
-            WEIGHT_SHORT_TERM * short_term.get(n, 0.0) +
-            WEIGHT_LONG_TERM * long_term.get(n, 0.0) +
-            WEIGHT_HOTNESS * hot_cold.get(n, 0.0)
-        )
+    # Preset multipliers (unknown presets behave as balanced)
+    multipliers = PRESET_MULTIPLIERS.get(preset, PRESET_MULTIPLIERS["balanced"])
+    dominance = multipliers["dominance"]
+    randomness_damp = multipliers["randomness_damp"]
 
-        # Allow dominance only in aggressive mode
-        if preset == "aggressive":
-            raw_score *= dominance
-        else:
-            raw_score = max(min(raw_score, dominance), -dominance)
+    raw = (
+        WEIGHT_SHORT_TERM * short_term +
+        WEIGHT_LONG_TERM * long_term +
+        WEIGHT_HOTNESS * hot_cold
+    )
 
-        confidence = min(abs(raw_score) * randomness_damp, 1.0)
+    # Allow dominance only in aggressive mode
+    if preset == "aggressive":
+        raw *= dominance
+    else:
+        np.clip(raw, -dominance, dominance, out=raw)
 
-        combined[n] = {
-            "score": raw_score,
-            "confidence": confidence,
-        }
+    confidence = np.minimum(np.abs(raw) * randomness_damp, 1.0)
 
-    return combined
+    return raw, confidence
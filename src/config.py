@@ -9,6 +9,8 @@ This file defines:
 No logic should live here.
 """
 
+from typing import NamedTuple
+
 # =========================
 # LOTTERY RULES
 # =========================
@@ -64,7 +66,18 @@ LINE_MODE_PARAMS = {
 # LOTTERY PROFILES
 # =========================
 
-LOTTERY_PROFILES = {
+class Profile(NamedTuple):
+    """Rules for one lottery. Bonus fields are unused when bonus is False."""
+    min: int
+    max: int
+    numbers_per_draw: int
+    bonus: bool
+    bonus_min: int = 0
+    bonus_max: int = 0
+    bonus_count: int = 0
+
+
+_RAW_PROFILES = {
     "irish_lotto": {
         "min": 1,
         "max": 47,
@@ -92,10 +105,7 @@ LOTTERY_PROFILES = {
         "bonus_max": 12,
         "bonus_count": 2,
     },
-}
-
-
- "powerball": {
+    "powerball": {
         "min": 1,
         "max": 69,
         "numbers_per_draw": 5,
@@ -113,3 +123,6 @@ LOTTERY_PROFILES = {
         "bonus_max": 25,
         "bonus_count": 1,
     },
+}
+
+LOTTERY_PROFILES = {name: Profile(**rules) for name, rules in _RAW_PROFILES.items()}
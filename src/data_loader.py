@@ -5,17 +5,51 @@ Responsibilities:
 - Load historical draw CSVs
 - Validate draws against lottery profiles
 - Parse main and bonus numbers into clean structures
+- Expose main numbers as a contiguous draws matrix
 """
 
+import numpy as np
 import pandas as pd
 from typing import List
 
-from src.config import LOTTERY_PROFILES
+from src.config import LOTTERY_PROFILES, Profile
 
 
 REQUIRED_COLUMNS = {"draw_date", "numbers", "lottery"}
 OPTIONAL_COLUMNS = {"bonus"}
 
+# df.attrs key for the draws matrix stashed by load_draw_data
+DRAWS_MATRIX_ATTR = "draws_matrix"
+
+# Fill value for unused trailing cells when lotteries with different
+# numbers_per_draw share one file
+_PAD = -1
+
+
+class _DrawsMatrix:
+    """
+    Main numbers of every loaded row as one (n_draws, width) int16 block,
+    with the row labels needed to select rows for filtered views.
+
+    Also keeps the per-row number arrays it was built from (and their ids),
+    so a frame whose labels or "numbers" column no longer match those
+    rows can be detected. Compared by identity, so pandas can carry it in
+    attrs safely; the block is read-only and shared rather than deep-copied
+    when pandas propagates attrs to derived frames and Series.
+    """
+
+    __slots__ = ("index", "values", "rows", "row_ids")
+
+    def __init__(self, index: pd.Index, values: np.ndarray, rows: np.ndarray):
+        self.index = index
+        self.values = values
+        # Holding the row arrays keeps their ids from being reused
+        self.rows = rows
+        self.row_ids = _object_ids(rows)
+
+    def __deepcopy__(self, memo):
+        return self
+
 
 def load_draw_data(csv_path: str) -> pd.DataFrame:
     """
@@ -27,15 +61,79 @@ def load_draw_data(csv_path: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Cleaned and validated draw data
     """
-    df = pd.read_csv(csv_path)
+    # Keep number columns as text so single values are not parsed as floats
+    df = pd.read_csv(csv_path, dtype={"numbers": str, "bonus": str})
 
     _validate_columns(df)
     df = _parse_numbers(df)
     df = _validate_draws(df)
 
+    _attach_draws_matrix(df)
+
     return df
 
 
+def get_draws_matrix(df: pd.DataFrame) -> np.ndarray:
+    """
+    Return the main numbers of df as an (n_draws, numbers_per_draw) int16 matrix.
+
+    Rows are taken from the matrix stashed by load_draw_data, so filtered or
+    tailed views of a loaded frame are not re-stacked. The stash is only
+    used when every row of df still holds the exact number array it was
+    built from, which each call checks by comparing the id() of every row's
+    array; that per-row check is still O(n_draws) Python work and is most
+    of the cost on large frames. Frames that were relabelled, had "numbers"
+    replaced, have no stash or mix draw widths are stacked from the column
+    instead.
+
+    Parameters:
+        df (pd.DataFrame): Draw data with a "numbers" column
+
+    Returns:
+        np.ndarray: Draws matrix, one row per draw
+    """
+    stash = df.attrs.get(DRAWS_MATRIX_ATTR)
+    if isinstance(stash, _DrawsMatrix) and len(df):
+        positions = stash.index.get_indexer(df.index)
+        if (positions >= 0).all() and (
+            # Labels alone may point at other rows (e.g. after reset_index)
+            _object_ids(df["numbers"].to_numpy()) == stash.row_ids[positions]
+        ).all():
+            rows = stash.values[positions]
+            widths = (rows != _PAD).sum(axis=1)
+            if (widths == widths[0]).all():
+                return rows[:, :widths[0]]
+
+    if not len(df):
+        return np.empty((0, 0), dtype=np.int16)
+
+    return np.stack(df["numbers"].to_numpy()).astype(np.int16, copy=False)
+
+
+def _attach_draws_matrix(df: pd.DataFrame) -> None:
+    """
+    Stash all main numbers in df.attrs as one contiguous int16 block.
+    Rows are left-aligned and padded when draw sizes differ between lotteries.
+    """
+    if not df.index.is_unique:
+        return
+
+    numbers = df["numbers"].to_numpy()
+    width = max((len(nums) for nums in numbers), default=0)
+
+    values = np.full((len(df), width), _PAD, dtype=np.int16)
+    for i, nums in enumerate(numbers):
+        values[i, :len(nums)] = nums
+    values.setflags(write=False)
+
+    df.attrs[DRAWS_MATRIX_ATTR] = _DrawsMatrix(df.index.copy(), values, numbers)
+
+
+def _object_ids(values: np.ndarray) -> np.ndarray:
+    """id() of every element of an object array."""
+    return np.fromiter(map(id, values), dtype=np.intp, count=len(values))
+
+
 def _validate_columns(df: pd.DataFrame) -> None:
     missing = REQUIRED_COLUMNS - set(df.columns)
     if missing:
@@ -45,69 +143,109 @@ def _validate_columns(df: pd.DataFrame) -> None:
 def _parse_numbers(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
 
-    df["numbers"] = df["numbers"].apply(_parse_number_list)
+    df["numbers"] = _parse_number_column(df["numbers"])
 
     if "bonus" in df.columns:
-        df["bonus"] = df["bonus"].apply(_parse_bonus_list)
+        df["bonus"] = _parse_number_column(df["bonus"])
 
     return df
 
 
-def _parse_number_list(value: str) -> List[int]:
-    return [int(n.strip()) for n in str(value).split(",") if n.strip()]
+def _parse_number_column(values: pd.Series) -> List[np.ndarray]:
+    """
+    Split a column of comma-separated numbers in one vectorized pass and
+    store each row as a small int64 array (the draws matrix is downcast to
+    int16 only after validation). Missing values parse to an empty array;
+    tokens that are not plain integers are rejected.
+    """
+    if not len(values):
+        return []
 
+    # Positional index so tokens can be regrouped by row
+    tokens = (
+        values.reset_index(drop=True)
+        .fillna("")
+        .astype(str)
+        .str.split(",")
+        .explode()
+        .str.strip()
+    )
+    tokens = tokens[tokens != ""]
 
-def _parse_bonus_list(value: str) -> List[int]:
-    if pd.isna(value):
-        return []
-    return [int(n.strip()) for n in str(value).split(",") if n.strip()]
+    invalid = ~tokens.str.fullmatch(r"[+-]?\d{1,18}")
+    if invalid.any():
+        pos = invalid.idxmax()
+        raise ValueError(f"Row {values.index[pos]}: Invalid number '{tokens[invalid].iat[0]}'")
 
+    flat = tokens.to_numpy().astype(np.int64)
+    counts = np.bincount(tokens.index.to_numpy(), minlength=len(values))
+    return np.split(flat, np.cumsum(counts)[:-1])
 
-def _validate_draws(df: pd.DataFrame) -> pd.DataFrame:
-    for idx, row in df.iterrows():
-        lottery = row["lottery"]
 
-        if lottery not in LOTTERY_PROFILES:
-            raise ValueError(f"Unknown lottery '{lottery}' at row {idx}")
+def _validate_draws(df: pd.DataFrame) -> pd.DataFrame:
+    unknown = ~df["lottery"].isin(list(LOTTERY_PROFILES))
+    if unknown.any():
+        idx = unknown.idxmax()
+        raise ValueError(f"Unknown lottery '{df.at[idx, 'lottery']}' at row {idx}")
 
+    # Validate each lottery's rows together instead of row by row
+    for lottery, grp in df.groupby("lottery", sort=False):
         profile = LOTTERY_PROFILES[lottery]
-        numbers = row["numbers"]
-        bonus = row.get("bonus", [])
 
-        _validate_main_numbers(numbers, profile, idx)
-        _validate_bonus_numbers(bonus, profile, idx)
+        _validate_main_numbers(grp["numbers"], profile)
+
+        if "bonus" in grp.columns:
+            bonus = grp["bonus"]
+        else:
+            bonus = pd.Series([[]] * len(grp), index=grp.index, dtype=object)
+        _validate_bonus_numbers(bonus, profile)
 
     return df
 
 
-def _validate_main_numbers(numbers: List[int], profile: dict, idx: int) -> None:
-    if len(numbers) != profile["numbers_per_draw"]:
+def _validate_main_numbers(numbers: pd.Series, profile: Profile) -> None:
+    lengths = numbers.map(len)
+    wrong_length = lengths != profile.numbers_per_draw
+    if wrong_length.any():
+        idx = wrong_length.idxmax()
         raise ValueError(
-            f"Row {idx}: Expected {profile['numbers_per_draw']} numbers, got {len(numbers)}"
+            f"Row {idx}: Expected {profile.numbers_per_draw} numbers, got {lengths[idx]}"
+        )
+
+    values = numbers.explode().astype(np.int64)
+    out_of_range = ~values.between(profile.min, profile.max)
+    if out_of_range.any():
+        idx = out_of_range.idxmax()
+        n = values[out_of_range].iat[0]
+        raise ValueError(
+            f"Row {idx}: Number {n} out of range ({profile.min}–{profile.max})"
         )
 
-    for n in numbers:
-        if not profile["min"] <= n <= profile["max"]:
-            raise ValueError(
-                f"Row {idx}: Number {n} out of range ({profile['min']}–{profile['max']})"
-            )
 
+def _validate_bonus_numbers(bonus: pd.Series, profile: Profile) -> None:
+    lengths = bonus.map(len)
 
-def _validate_bonus_numbers(bonus: List[int], profile: dict, idx: int) -> None:
-    if not profile.get("bonus", False):
-        if bonus:
+    if not profile.bonus:
+        unexpected = lengths > 0
+        if unexpected.any():
+            idx = unexpected.idxmax()
             raise ValueError(f"Row {idx}: Bonus numbers not expected for this lottery")
         return
 
-    expected = profile["bonus_count"]
-    if len(bonus) != expected:
+    expected = profile.bonus_count
+    wrong_length = lengths != expected
+    if wrong_length.any():
+        idx = wrong_length.idxmax()
         raise ValueError(
-            f"Row {idx}: Expected {expected} bonus numbers, got {len(bonus)}"
+            f"Row {idx}: Expected {expected} bonus numbers, got {lengths[idx]}"
         )
 
-    for b in bonus:
-        if not profile["bonus_min"] <= b <= profile["bonus_max"]:
-            raise ValueError(
-                f"Row {idx}: Bonus number {b} out of range "
-                f"({profile['bonus_min']}–{profile['bonus_max']})"
-            )
+    values = bonus.explode().dropna().astype(np.int64)
+    out_of_range = ~values.between(profile.bonus_min, profile.bonus_max)
+    if out_of_range.any():
+        idx = out_of_range.idxmax()
+        b = values[out_of_range].iat[0]
+        raise ValueError(
+            f"Row {idx}: Bonus number {b} out of range "
+            f"({profile.bonus_min}–{profile.bonus_max})"
+        )
@@ -13,16 +13,23 @@ Supports bonus balls (EuroMillions, Powerball, Mega Millions) if draw data conta
 
 from __future__ import annotations
 
-import math
-import random
-from itertools import combinations
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import pandas as pd
 
-from src.config import LOTTERY_PROFILES
-from src.signals import short_term_trend_signal, long_term_trend_signal, hot_cold_gap_signal
-from src.combiner import combine_signals
+from src.accel import HAVE_NUMBA, njit, prange
+from src.config import (
+    LOTTERY_PROFILES,
+    Profile,
+    SHORT_TERM_WINDOW,
+    WEIGHT_SHORT_TERM,
+    WEIGHT_LONG_TERM,
+    WEIGHT_HOTNESS,
+)
+from src.data_loader import get_draws_matrix
+from src.signals import compute_all_signals, scan_draws
+from src.combiner import PRESET_MULTIPLIERS, combine_signals
 
 
 # -------------------------
@@ -37,6 +44,11 @@ PRESET_PARAMS = {
     "aggressive": {"temperature": 1.7, "randomness_blend": 0.10, "pair_strength": 0.60},
 }
 
+# Pair-boosted requests of at least this many lines (e.g. backtests) use the
+# parallel compiled sampler; smaller ones stay on the NumPy sampler, where
+# the one-off kernel compilation would cost far more than it saves
+_JIT_MIN_LINES = 1000
+
 
 # -------------------------
 # Public API
@@ -62,13 +74,15 @@ def generate_lines(
         locked_numbers (list[int] | None): numbers to force into every line (main numbers only)
         enforce_balance (bool): toggle balance constraints for main numbers
         use_pairs (bool): apply pair co-occurrence boosting during selection
-        seed (int | None): random seed for reproducibility
+        seed (int | None): random seed for reproducibility. Output is
+            repeatable for a given seed on one install, but pair-boosted
+            batches that take the compiled sampler draw different lines
+            than the NumPy sampler does
 
     Returns:
         List[dict]: Each item has {"numbers": [...], "bonus": [...]} (bonus may be empty)
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     if preset not in PRESET_PARAMS:
         raise ValueError(f"Unknown preset '{preset}'. Use: {list(PRESET_PARAMS.keys())}")
@@ -76,6 +90,9 @@ def generate_lines(
     if lottery not in LOTTERY_PROFILES:
         raise ValueError(f"Unknown lottery '{lottery}'. Check LOTTERY_PROFILES in config.py")
 
+    if num_lines < 0:
+        raise ValueError(f"num_lines must be non-negative, got {num_lines}")
+
     profile = LOTTERY_PROFILES[lottery]
     locked_numbers = locked_numbers or []
 
@@ -84,36 +101,82 @@ def generate_lines(
     if df_l.empty:
         raise ValueError(f"No rows found for lottery='{lottery}' in the provided dataset")
 
-    # Build base combined scores for main numbers
-    main_combined = _build_combined_for_pool(
-        df_l, profile["min"], profile["max"], preset=preset
+    # Build base sampling weights for main numbers
+    main_weights = _build_base_weights(
+        df_l, profile.min, profile.max, preset=preset
     )
 
     # Pair lifts for main numbers (optional)
-    pair_lifts = _compute_pair_lifts(df_l, profile["min"], profile["max"]) if use_pairs else {}
+    pair_lifts = _compute_pair_lifts(df_l, profile.min, profile.max) if use_pairs else None
 
     # Validate locks
     _validate_locks(locked_numbers, profile)
 
-    results: List[Dict[str, List[int]]] = []
+    # Balance lookup tables for this lottery's number range
+    odd_mask, low_mask = _balance_masks(profile.min, profile.max)
 
-    for _ in range(num_lines):
-        line_numbers = _generate_single_line(
-            combined=main_combined,
-            min_n=profile["min"],
-            max_n=profile["max"],
-            count=profile["numbers_per_draw"],
+    if use_pairs and HAVE_NUMBA and num_lines >= _JIT_MIN_LINES:
+        # Compiled sampler over the weight and pair-lift arrays, run in parallel
+        main_lines = _generate_lines_jit(
+            base_w=main_weights,
+            pair_lifts=pair_lifts,
+            min_n=profile.min,
+            max_n=profile.max,
+            count=profile.numbers_per_draw,
             preset=preset,
             locked=locked_numbers,
             enforce_balance=enforce_balance,
-            pair_lifts=pair_lifts,
-            use_pairs=use_pairs,
-        )
+            odd_mask=odd_mask,
+            low_mask=low_mask,
+            num_lines=num_lines,
+            rng=rng,
+        ).tolist()
+    elif use_pairs:
+        main_lines = [
+            _generate_single_line(
+                base_w=main_weights,
+                min_n=profile.min,
+                max_n=profile.max,
+                count=profile.numbers_per_draw,
+                preset=preset,
+                locked=locked_numbers,
+                enforce_balance=enforce_balance,
+                odd_mask=odd_mask,
+                low_mask=low_mask,
+                pair_lifts=pair_lifts,
+                use_pairs=use_pairs,
+                rng=rng,
+            )
+            for _ in range(num_lines)
+        ]
+    else:
+        # Without pair boosts every pick uses the same weights, so all lines
+        # can be sampled at once
+        main_lines = _generate_lines_batch(
+            base_w=main_weights,
+            min_n=profile.min,
+            max_n=profile.max,
+            count=profile.numbers_per_draw,
+            preset=preset,
+            locked=locked_numbers,
+            enforce_balance=enforce_balance,
+            odd_mask=odd_mask,
+            low_mask=low_mask,
+            num_lines=num_lines,
+            rng=rng,
+        ).tolist()
 
+    # Bonus weights are the same for every line, so build them once
+    has_bonus = profile.bonus
+    bonus_weights = _build_bonus_weights(df_l, profile, preset=preset) if has_bonus else None
+
+    results: List[Dict[str, List[int]]] = []
+
+    for line_numbers in main_lines:
         # Bonus handling (if applicable)
         bonus_numbers: List[int] = []
-        if profile.get("bonus", False):
-            bonus_numbers = _generate_bonus_numbers(df_l, profile, preset=preset)
+        if has_bonus:
+            bonus_numbers = _generate_bonus_numbers(bonus_weights, profile, rng=rng)
 
         results.append({
             "numbers": sorted(line_numbers),
@@ -126,80 +189,180 @@ def generate_lines(
 # -------------------------
 # Core building blocks
 # -------------------------
-def _build_combined_for_pool(df_pool: pd.DataFrame, min_n: int, max_n: int, preset: str) -> Dict[int, Dict[str, float]]:
+def _build_combined_for_pool(df_pool: pd.DataFrame, min_n: int, max_n: int, preset: str) -> Tuple[np.ndarray, np.ndarray]:
     """
     Compute signals + combine_signals for a given pool (main or bonus).
-    Returns dict: number -> {"score": float, "confidence": float}
+    Returns (scores, confidences) arrays indexed by number - min_n.
     """
-    st = short_term_trend_signal(df_pool, min_n, max_n)
-    lt = long_term_trend_signal(df_pool, min_n, max_n)
-    gap = hot_cold_gap_signal(df_pool, min_n, max_n)
+    st, lt, gap = compute_all_signals(df_pool, min_n, max_n)
     combined = combine_signals(st, lt, gap, preset=preset)
     return combined
 
 
+def _build_base_weights(df_pool: pd.DataFrame, min_n: int, max_n: int, preset: str) -> np.ndarray:
+    """
+    Per-number base sampling weights exp(score * temperature) for a pool (main or bonus).
+
+    With Numba available, signals, combination and exponentiation run as a
+    single fused kernel over the draw matrix; otherwise the NumPy signal and
+    combiner functions are used.
+    """
+    if HAVE_NUMBA:
+        return _compute_fused_base_weights(get_draws_matrix(df_pool), min_n, max_n, preset)
+
+    return _base_weights(_build_combined_for_pool(df_pool, min_n, max_n, preset)[0], preset)
+
+
+def _compute_fused_base_weights(draws: np.ndarray, min_n: int, max_n: int, preset: str) -> np.ndarray:
+    """Run the fused Numba kernel with the configured signal weights and preset."""
+    return _fused_base_weights(
+        draws,
+        min_n,
+        max_n,
+        SHORT_TERM_WINDOW,
+        WEIGHT_SHORT_TERM,
+        WEIGHT_LONG_TERM,
+        WEIGHT_HOTNESS,
+        PRESET_MULTIPLIERS[preset]["dominance"],
+        preset == "aggressive",
+        PRESET_PARAMS[preset]["temperature"],
+    )
+
+
+@njit(cache=True)
+def _fused_base_weights(
+    draws,
+    min_n,
+    max_n,
+    short_window,
+    w_short,
+    w_long,
+    w_hot,
+    dominance,
+    aggressive,
+    temperature,
+):
+    """
+    Numba kernel equivalent to the three signals + combine_signals + _base_weights.
+
+    draws is an (n_draws, numbers_per_draw) int array. All counting happens in
+    one pass (signals.scan_draws); the rest is a few length-N loops.
+    """
+    n_draws, k = draws.shape
+    pool_size = max_n - min_n + 1
+    short_start = max(n_draws - short_window, 0)
+
+    short_counts, long_counts, last_seen = scan_draws(draws, min_n, pool_size, short_window)
+
+    # Reciprocal expected frequency under uniform randomness
+    inv_short_expected = pool_size / ((n_draws - short_start) * k)
+    inv_long_expected = pool_size / (n_draws * k)
+
+    short_term = np.empty(pool_size)
+    long_term = np.empty(pool_size)
+    gaps = np.empty(pool_size)
+    for v in range(pool_size):
+        short_term[v] = short_counts[v] * inv_short_expected - 1.0
+        long_term[v] = long_counts[v] * inv_long_expected - 1.0
+        gaps[v] = n_draws - 1 - last_seen[v]  # never seen (-1) → max gap
+
+    # Normalize each signal to [-1, 1]
+    short_max = np.max(np.abs(short_term))
+    long_max = np.max(np.abs(long_term))
+    gap_max = np.max(gaps)
+    if short_max == 0:
+        short_max = 1.0
+    if long_max == 0:
+        long_max = 1.0
+    if gap_max == 0:
+        gap_max = 1.0
+
+    weights = np.empty(pool_size)
+    for v in range(pool_size):
+        raw = (
+            w_short * short_term[v] / short_max +
+            w_long * long_term[v] / long_max +
+            w_hot * gaps[v] / gap_max
+        )
+
+        # Allow dominance only in aggressive mode
+        if aggressive:
+            raw *= dominance
+        else:
+            raw = max(min(raw, dominance), -dominance)
+
+        weights[v] = np.exp(raw * temperature)
+
+    return weights
+
+
+def _base_weights(scores: np.ndarray, preset: str) -> np.ndarray:
+    """
+    Biased weights via softmax-ish exponentiation, one per pool number.
+    Scores and temperature are fixed for a line, so this is computed once
+    rather than per pick.
+    """
+    # temperature shapes how peaky it gets
+    return np.exp(scores * PRESET_PARAMS[preset]["temperature"])
+
+
 def _scores_to_weights(
-    combined: Dict[int, Dict[str, float]],
-    candidates: List[int],
+    base_w: np.ndarray,
     preset: str,
-    pair_boosts: Optional[Dict[int, float]] = None,
-) -> List[float]:
+    pair_boosts: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """
-    Convert combined scores into sampling weights with preset shaping and randomness blending.
-    pair_boosts: optional dict[number] -> boost in [0, +inf), applied multiplicatively.
+    Convert base weights into sampling weights with pair boosting and
+    randomness blending.
+    pair_boosts: optional array aligned with base_w, boost in [0, +inf), applied multiplicatively.
     """
-    params = PRESET_PARAMS[preset]
-    temperature = params["temperature"]
-    randomness_blend = params["randomness_blend"]
-
-    # Biased weights via softmax-ish exponentiation
-    raw = []
-    for n in candidates:
-        score = combined[n]["score"]
-        # temperature shapes how peaky it gets
-        w = math.exp(score * temperature)
-        if pair_boosts and n in pair_boosts:
-            w *= (1.0 + pair_boosts[n])
-        raw.append(w)
+    randomness_blend = PRESET_PARAMS[preset]["randomness_blend"]
+
+    w = base_w.copy()
+    if pair_boosts is not None:
+        w *= (1.0 + pair_boosts)
 
     # Blend with uniform weights (honest fallback)
     # uniform weights = 1.0 for each candidate
-    blended = []
-    for w in raw:
-        blended.append((1.0 - randomness_blend) * w + randomness_blend * 1.0)
-
-    return blended
+    w *= (1.0 - randomness_blend)
+    w += randomness_blend
+    return w
 
 
-def _weighted_choice_no_replace(candidates: List[int], weights: List[float]) -> int:
-    """Choose a single item from candidates given weights (no replacement done by caller)."""
-    total = sum(weights)
+def _weighted_choice_no_replace(weights: np.ndarray, alive: np.ndarray, rng: np.random.Generator) -> int:
+    """
+    Choose a single index given weights (no replacement done by caller).
+    Zero-weight entries are never chosen, so callers zero out taken numbers;
+    alive marks the indices still available for the uniform fallback.
+    """
+    cum = np.cumsum(weights)
+    total = cum[-1]
     if total <= 0:
-        # fallback to uniform
-        return random.choice(candidates)
+        # fallback to uniform over the numbers not yet taken
+        return int(rng.choice(np.flatnonzero(alive)))
 
-    r = random.random() * total
-    upto = 0.0
-    for item, w in zip(candidates, weights):
-        upto += w
-        if upto >= r:
-            return item
-    return candidates[-1]
+    idx = int(np.searchsorted(cum, rng.random() * total, side="right"))
+    return min(idx, len(weights) - 1)
 
 
 def _generate_single_line(
-    combined: Dict[int, Dict[str, float]],
+    base_w: np.ndarray,
     min_n: int,
     max_n: int,
     count: int,
     preset: str,
     locked: List[int],
     enforce_balance: bool,
-    pair_lifts: Dict[Tuple[int, int], float],
+    odd_mask: np.ndarray,
+    low_mask: np.ndarray,
+    pair_lifts: Optional[np.ndarray],
     use_pairs: bool,
+    rng: np.random.Generator,
 ) -> List[int]:
     """
     Sequentially generate one line without replacement, optionally applying balance constraints and pair boosting.
+    base_w: per-number base weights from _build_base_weights().
+    odd_mask / low_mask: balance lookup tables from _balance_masks().
     """
     # We'll retry a few times if balance constraints fail
     attempts = 0
@@ -207,24 +370,27 @@ def _generate_single_line(
         attempts += 1
 
         selected = list(dict.fromkeys(locked))  # preserve order, unique
-        remaining = [n for n in range(min_n, max_n + 1) if n not in selected]
+        alive = np.ones(max_n - min_n + 1, dtype=bool)
+        alive[[n - min_n for n in selected]] = False
 
         # Build line sequentially
         while len(selected) < count:
             # Pair boosts depend on what we've already selected
-            pair_boosts = {}
+            pair_boosts = None
             if use_pairs and selected:
-                pair_boosts = _pair_boosts_from_selected(selected, remaining, pair_lifts, preset=preset)
+                pair_boosts = _pair_boosts_from_selected(selected, pair_lifts, min_n, preset=preset)
 
-            weights = _scores_to_weights(combined, remaining, preset=preset, pair_boosts=pair_boosts)
-            pick = _weighted_choice_no_replace(remaining, weights)
+            # Taken numbers get zero weight
+            weights = _scores_to_weights(base_w, preset=preset, pair_boosts=pair_boosts)
+            weights *= alive
+            pick = _weighted_choice_no_replace(weights, alive, rng)
 
-            selected.append(pick)
-            remaining.remove(pick)
+            selected.append(min_n + pick)
+            alive[pick] = False
 
         # Validate constraints
         if enforce_balance:
-            if _passes_balance(selected, min_n, max_n):
+            if _passes_balance(np.asarray(selected) - min_n, odd_mask, low_mask):
                 return selected
         else:
             return selected
@@ -233,56 +399,298 @@ def _generate_single_line(
     return selected
 
 
+def _generate_lines_jit(
+    base_w: np.ndarray,
+    pair_lifts: np.ndarray,
+    min_n: int,
+    max_n: int,
+    count: int,
+    preset: str,
+    locked: List[int],
+    enforce_balance: bool,
+    odd_mask: np.ndarray,
+    low_mask: np.ndarray,
+    num_lines: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Numba counterpart of calling _generate_single_line once per line.
+
+    Lines are independent, so they are generated in parallel. Each line
+    seeds Numba's random state from a base seed drawn from rng, which keeps
+    results reproducible for a given seed regardless of thread scheduling.
+    Returns an int array of shape (num_lines, count).
+    """
+    params = PRESET_PARAMS[preset]
+    locked_idx = np.asarray(list(dict.fromkeys(locked)), dtype=np.int64) - min_n
+
+    return _line_batch_kernel(
+        base_w,
+        pair_lifts,
+        locked_idx,
+        count,
+        min_n,
+        max_n,
+        params["randomness_blend"],
+        params["pair_strength"],
+        enforce_balance,
+        odd_mask,
+        low_mask,
+        num_lines,
+        int(rng.integers(2**31 - num_lines)),
+    )
+
+
+@njit(cache=True, parallel=True)
+def _line_batch_kernel(
+    base_w,
+    pair_lifts,
+    locked_idx,
+    count,
+    min_n,
+    max_n,
+    randomness_blend,
+    pair_strength,
+    enforce_balance,
+    odd_mask,
+    low_mask,
+    num_lines,
+    seed,
+):
+    """
+    Run _line_kernel for num_lines lines across threads.
+    Line i uses seed + i, and each thread writes only its own output row.
+    """
+    lines = np.empty((num_lines, count), dtype=np.int64)
+
+    for i in prange(num_lines):
+        np.random.seed(seed + i)
+        lines[i] = _line_kernel(
+            base_w,
+            pair_lifts,
+            locked_idx,
+            count,
+            min_n,
+            max_n,
+            randomness_blend,
+            pair_strength,
+            enforce_balance,
+            odd_mask,
+            low_mask,
+        )
+
+    return lines
+
+
+@njit(cache=True, fastmath=True)
+def _line_kernel(
+    base_w,
+    pair_lifts,
+    locked_idx,
+    count,
+    min_n,
+    max_n,
+    randomness_blend,
+    pair_strength,
+    enforce_balance,
+    odd_mask,
+    low_mask,
+):
+    """
+    Compiled _generate_single_line: sequential weighted picks without
+    replacement with pair boosting, retried until the line passes balance.
+
+    base_w, pair_lifts and the balance masks are indexed by number - min_n;
+    locked_idx holds locked numbers as pool indices. Returns the line's numbers.
+    """
+    pool_size = base_w.shape[0]
+    line = np.empty(count, dtype=np.int64)
+    alive = np.empty(pool_size, dtype=np.bool_)
+    lift_sums = np.empty(pool_size)
+    cum = np.empty(pool_size)
+
+    # We'll retry a few times if balance constraints fail
+    for _ in range(200):
+        alive[:] = True
+        lift_sums[:] = 0.0
+        n_selected = 0
+
+        for idx in locked_idx:
+            line[n_selected] = idx
+            n_selected += 1
+            alive[idx] = False
+            lift_sums += pair_lifts[idx]
+
+        # Build line sequentially
+        while n_selected < count:
+            total = 0.0
+            n_alive = 0
+            for v in range(pool_size):
+                if alive[v]:
+                    w = base_w[v] * (1.0 + lift_sums[v] * pair_strength)
+                    total += (1.0 - randomness_blend) * w + randomness_blend
+                    n_alive += 1
+                cum[v] = total
+
+            if total <= 0:
+                # fallback to uniform over the numbers not yet taken
+                remaining = int(np.random.random() * n_alive)
+                for v in range(pool_size):
+                    if alive[v]:
+                        if remaining == 0:
+                            pick = v
+                            break
+                        remaining -= 1
+            else:
+                pick = min(np.searchsorted(cum, np.random.random() * total, side="right"), pool_size - 1)
+
+            line[n_selected] = pick
+            n_selected += 1
+            alive[pick] = False
+            lift_sums += pair_lifts[pick]
+
+        if not enforce_balance or _line_passes_balance(line, odd_mask, low_mask):
+            break
+
+    # If we fail balance too many times, return last generated (always output something)
+    return line + min_n
+
+
+@njit(cache=True)
+def _line_passes_balance(line_idx, odd_mask, low_mask):
+    """Compiled _passes_balance."""
+    k = line_idx.shape[0]
+    if k < 6:
+        return True
+
+    odds = 0
+    low = 0
+    for idx in line_idx:
+        odds += odd_mask[idx]
+        low += low_mask[idx]
+
+    # Allow mild skew: for 6 numbers, allow 2–4 either way.
+    return 2 <= odds <= 4 and 2 <= low <= 4
+
+
+def _generate_lines_batch(
+    base_w: np.ndarray,
+    min_n: int,
+    max_n: int,
+    count: int,
+    preset: str,
+    locked: List[int],
+    enforce_balance: bool,
+    odd_mask: np.ndarray,
+    low_mask: np.ndarray,
+    num_lines: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Generate all lines at once when weights do not change between picks (no pair boosting).
+
+    Sampling `count` numbers without replacement is Gumbel-top-k: perturb the
+    log-weights with Gumbel noise and keep the `count` largest keys. Locked
+    numbers get an infinite key so they are always kept. Lines failing the
+    balance constraints are resampled together on the next attempt.
+
+    Returns an int array of shape (num_lines, count).
+    """
+    log_w = np.log(_scores_to_weights(base_w, preset=preset))
+    locked_idx = np.asarray(sorted(set(locked)), dtype=np.intp) - min_n
+
+    lines = np.empty((num_lines, count), dtype=np.int64)
+    pending = np.arange(num_lines)
+
+    # We'll retry a few times if balance constraints fail
+    for _ in range(200):
+        keys = log_w + rng.gumbel(size=(len(pending), len(log_w)))
+        keys[:, locked_idx] = np.inf
+
+        picks = np.argpartition(keys, -count, axis=1)[:, -count:]
+        lines[pending] = picks + min_n
+
+        if not enforce_balance:
+            break
+
+        pending = pending[~_passes_balance_batch(picks, odd_mask, low_mask)]
+        if pending.size == 0:
+            break
+
+    # Lines still failing balance keep their last sample (always output something)
+    return lines
+
+
 # -------------------------
 # Balance constraints (simple & product-friendly)
 # -------------------------
-def _passes_balance(numbers: List[int], min_n: int, max_n: int) -> bool:
+def _balance_masks(min_n: int, max_n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-number lookup tables for the balance rules, indexed by number - min_n:
+    odd_mask is 1 for odd numbers, low_mask is True at or below the midpoint.
     """
-    Simple balance rules:
+    numbers = np.arange(min_n, max_n + 1)
+    midpoint = (min_n + max_n) / 2.0
+
+    return numbers & 1, numbers <= midpoint
+
+
+def _passes_balance(line_idx: np.ndarray, odd_mask: np.ndarray, low_mask: np.ndarray) -> bool:
+    """
+    Simple balance rules for one line given as pool indices:
     - Odd/even not too skewed
     - Low/high not too skewed (split at midpoint)
     """
-    k = len(numbers)
-    odds = sum(1 for n in numbers if n % 2 == 1)
-    evens = k - odds
+    k = len(line_idx)
 
     # Allow mild skew: for 6 numbers, allow 2–4 either way.
-    if k >= 6:
-        if odds < 2 or odds > 4:
-            return False
+    if k < 6:
+        return True
 
-    midpoint = (min_n + max_n) / 2.0
-    low = sum(1 for n in numbers if n <= midpoint)
-    high = k - low
+    odds = odd_mask[line_idx].sum()
+    low = low_mask[line_idx].sum()
 
-    if k >= 6:
-        if low < 2 or low > 4:
-            return False
+    return 2 <= odds <= 4 and 2 <= low <= 4
 
-    return True
+
+def _passes_balance_batch(lines_idx: np.ndarray, odd_mask: np.ndarray, low_mask: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _passes_balance over a (num_lines, k) array of pool indices.
+    Returns a boolean mask of the lines that pass.
+    """
+    k = lines_idx.shape[1]
+
+    # Allow mild skew: for 6 numbers, allow 2–4 either way.
+    if k < 6:
+        return np.ones(len(lines_idx), dtype=bool)
+
+    odds = odd_mask[lines_idx].sum(axis=1)
+    low = low_mask[lines_idx].sum(axis=1)
+
+    return (odds >= 2) & (odds <= 4) & (low >= 2) & (low <= 4)
 
 
 # -------------------------
 # Locks
 # -------------------------
-def _validate_locks(locked: List[int], profile: dict) -> None:
+def _validate_locks(locked: List[int], profile: Profile) -> None:
     if len(set(locked)) != len(locked):
         raise ValueError("Locked numbers contain duplicates")
 
-    if len(locked) > profile["numbers_per_draw"]:
+    if len(locked) > profile.numbers_per_draw:
         raise ValueError(
-            f"Too many locked numbers: {len(locked)} > numbers_per_draw ({profile['numbers_per_draw']})"
+            f"Too many locked numbers: {len(locked)} > numbers_per_draw ({profile.numbers_per_draw})"
         )
 
     for n in locked:
-        if not profile["min"] <= n <= profile["max"]:
-            raise ValueError(f"Locked number {n} out of range ({profile['min']}–{profile['max']})")
+        if not profile.min <= n <= profile.max:
+            raise ValueError(f"Locked number {n} out of range ({profile.min}–{profile.max})")
 
 
 # -------------------------
 # Pair analysis & boosting
 # -------------------------
-def _compute_pair_lifts(df_l: pd.DataFrame, min_n: int, max_n: int) -> Dict[Tuple[int, int], float]:
+def _compute_pair_lifts(df_l: pd.DataFrame, min_n: int, max_n: int) -> np.ndarray:
     """
     Compute a simple pair lift metric:
     lift(a,b) = observed_pair_count / expected_pair_count
@@ -290,102 +698,91 @@ def _compute_pair_lifts(df_l: pd.DataFrame, min_n: int, max_n: int) -> Dict[Tupl
     expected_pair_count approximated using independent appearance probabilities per draw:
     expected = total_draws * p(a) * p(b)
 
-    Returns dict[(a,b)] = max(0, lift - 1) capped for stability.
+    Returns a symmetric (N, N) matrix indexed by number - min_n holding
+    max(0, lift - 1) capped for stability, with a zero diagonal.
     """
-    total_draws = len(df_l)
+    pool_size = max_n - min_n + 1
+    draws = get_draws_matrix(df_l)
+    total_draws, numbers_per_draw = draws.shape
     if total_draws == 0:
-        return {}
+        return np.zeros((pool_size, pool_size), dtype=np.float32)
 
-    # Count individual appearances per draw (not per occurrence)
-    indiv = {n: 0 for n in range(min_n, max_n + 1)}
-    pair_counts: Dict[Tuple[int, int], int] = {}
+    # Per-draw appearance indicators (not per occurrence)
+    rows = np.repeat(np.arange(total_draws), numbers_per_draw)
+    flat = draws.ravel().astype(np.int64)
+    in_range = (flat >= min_n) & (flat <= max_n)
 
-    for nums in df_l["numbers"]:
-        unique_nums = sorted(set(nums))
-        for n in unique_nums:
-            if min_n <= n <= max_n:
-                indiv[n] += 1
+    indicators = np.zeros((total_draws, pool_size), dtype=np.float32)
+    indicators[rows[in_range], flat[in_range] - min_n] = 1.0
 
-        for a, b in combinations(unique_nums, 2):
-            if not (min_n <= a <= max_n and min_n <= b <= max_n):
-                continue
-            key = (a, b)
-            pair_counts[key] = pair_counts.get(key, 0) + 1
+    # Co-occurrence counts; the diagonal holds individual appearance counts
+    pair_counts = indicators.T @ indicators
+    indiv = np.diag(pair_counts)
 
     # Compute lifts
-    lifts: Dict[Tuple[int, int], float] = {}
     eps = 1e-9
-    for (a, b), observed in pair_counts.items():
-        pa = indiv[a] / total_draws
-        pb = indiv[b] / total_draws
-        expected = total_draws * pa * pb
-        lift = observed / (expected + eps)
+    expected = np.outer(indiv, indiv) / total_draws
+    lifts = pair_counts / (expected + eps)
 
-        # Convert to a stable "excess association" in [0, cap]
-        excess = max(0.0, lift - 1.0)
-        lifts[(a, b)] = min(excess, 2.0)  # cap prevents dominance
+    # Convert to a stable "excess association" in [0, cap]
+    excess = np.clip(lifts - 1.0, 0.0, 2.0)  # cap prevents dominance
+    np.fill_diagonal(excess, 0.0)
 
-    return lifts
+    return excess.astype(np.float32)
 
 
 def _pair_boosts_from_selected(
     selected: List[int],
-    candidates: List[int],
-    pair_lifts: Dict[Tuple[int, int], float],
+    pair_lifts: np.ndarray,
+    min_n: int,
     preset: str,
-) -> Dict[int, float]:
+) -> np.ndarray:
     """
     Convert pair lifts into candidate boosts based on already selected numbers.
     Boost is the sum of excess lifts with selected numbers, scaled by preset strength.
+    Returns an array over the whole pool, indexed by number - min_n.
     """
     strength = PRESET_PARAMS[preset]["pair_strength"]
-    boosts: Dict[int, float] = {}
+    selected_idx = np.asarray(selected, dtype=np.intp) - min_n
 
-    for c in candidates:
-        total = 0.0
-        for s in selected:
-            a, b = (s, c) if s < c else (c, s)
-            total += pair_lifts.get((a, b), 0.0)
-        if total > 0:
-            boosts[c] = total * strength
-
-    return boosts
+    return pair_lifts[selected_idx].sum(axis=0) * strength
 
 
 # -------------------------
 # Bonus number generation
 # -------------------------
-def _generate_bonus_numbers(df_l: pd.DataFrame, profile: dict, preset: str) -> List[int]:
+def _build_bonus_weights(df_l: pd.DataFrame, profile: Profile, preset: str) -> Optional[np.ndarray]:
     """
-    Generate bonus numbers if the dataset contains bonus history; otherwise use uniform sampling.
+    Build bonus-ball sampling weights from bonus history.
+    Returns None when there is no bonus history (uniform sampling is used).
     """
-    bonus_count = profile["bonus_count"]
-    bonus_min = profile["bonus_min"]
-    bonus_max = profile["bonus_max"]
-
     # If no bonus history column exists, fall back to uniform
     if "bonus" not in df_l.columns:
-        pool = list(range(bonus_min, bonus_max + 1))
-        random.shuffle(pool)
-        return pool[:bonus_count]
+        return None
 
     # Build a temporary "numbers" view of bonus history so we can reuse signals/combiner
     df_b = df_l.copy()
-    df_b["numbers"] = df_b["bonus"].apply(lambda x: x if isinstance(x, list) else [])
+    df_b["numbers"] = df_b["bonus"].apply(lambda x: x if isinstance(x, (list, np.ndarray)) else [])
 
     # If bonus entries are empty, fallback uniform
     if df_b["numbers"].map(len).sum() == 0:
-        pool = list(range(bonus_min, bonus_max + 1))
-        random.shuffle(pool)
-        return pool[:bonus_count]
+        return None
+
+    base_w = _build_base_weights(df_b, profile.bonus_min, profile.bonus_max, preset=preset)
 
-    combined_bonus = _build_combined_for_pool(df_b, bonus_min, bonus_max, preset=preset)
+    # No pair boosting for bonus balls, so the weights are fixed for every pick
+    weights = _scores_to_weights(base_w, preset=preset)
+    return weights / weights.sum()
 
-    selected: List[int] = []
-    remaining = list(range(bonus_min, bonus_max + 1))
 
-    while len(selected) < bonus_count:
-        weights = _scores_to_weights(combined_bonus, remaining, preset=preset)
-        pick = _weighted_choice_no_replace(remaining, weights)
-        selected.append(pick)
-        remaining.remove(pick)
+def _generate_bonus_numbers(
+    bonus_weights: Optional[np.ndarray],
+    profile: Profile,
+    rng: np.random.Generator,
+) -> List[int]:
+    """
+    Generate bonus numbers from precomputed bonus weights; uniform sampling if there are none.
+    The whole draw is a single weighted sample without replacement.
+    """
+    pool = np.arange(profile.bonus_min, profile.bonus_max + 1)
+    return rng.choice(pool, size=profile.bonus_count, replace=False, p=bonus_weights).tolist()
@@ -8,11 +8,7 @@ This script demonstrates:
 """
 
 from src.data_loader import load_draw_data
-from src.signals import (
-    short_term_trend_signal,
-    long_term_trend_signal,
-    hot_cold_gap_signal,
-)
+from src.signals import compute_all_signals
 from src.combiner import combine_signals
 from src.number_mode import predict_numbers
 from src.line_mode import generate_lines
@@ -33,15 +29,13 @@ def main():
     profile = LOTTERY_PROFILES[LOTTERY]
 
     # --- Build signals ---
-    st = short_term_trend_signal(df_l, profile["min"], profile["max"])
-    lt = long_term_trend_signal(df_l, profile["min"], profile["max"])
-    gap = hot_cold_gap_signal(df_l, profile["min"], profile["max"])
+    st, lt, gap = compute_all_signals(df_l, profile.min, profile.max)
 
     combined = combine_signals(st, lt, gap, preset=PRESET)
 
     # --- Number Mode ---
     print("\n🔢 Number Prediction Mode")
-    top_number = predict_numbers(combined, count=1)
+    top_number = predict_numbers(combined, count=1, min_number=profile.min)
     for item in top_number:
         print(item)
 
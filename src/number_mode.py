@@ -5,66 +5,82 @@ This module provides ranked number recommendations based on
 combined bias scores and confidence levels.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+import numpy as np
 
 
 def predict_numbers(
-    combined_scores: Dict[int, Dict[str, float]],
+    combined_scores: Tuple[np.ndarray, np.ndarray],
     count: int = 1,
     min_confidence: float = 0.0,
+    min_number: int = 1,
 ) -> List[Dict[str, float]]:
     """
     Predict favored lottery numbers.
 
     Parameters:
-        combined_scores (dict): Output from combine_signals()
+        combined_scores (tuple): (scores, confidences) output from combine_signals()
         count (int): Number of numbers to return (default = 1)
         min_confidence (float): Minimum confidence threshold
+        min_number (int): Number held at index 0 of the score arrays
 
     Returns:
         List[dict]: Ranked number predictions
     """
+    scores, confidences = combined_scores
+
     # Filter by confidence
-    filtered = {
-        n: data for n, data in combined_scores.items()
-        if data["confidence"] >= min_confidence
-    }
-
-    # Sort by score descending
-    ranked = sorted(
-        filtered.items(),
-        key=lambda x: x[1]["score"],
-        reverse=True
-    )
+    candidates = np.flatnonzero(confidences >= min_confidence)
+    k = min(count, len(candidates))
+    if k <= 0:
+        return []
+
+    # Rank by score; the stable sort breaks ties towards the lowest number
+    top = candidates[np.argsort(-scores[candidates], kind="stable")[:k]]
 
+    top_scores = scores[top]
+    explanations = _explain_scores(top_scores)
+
+    # Unbox each column in one tolist() pass instead of per-element casts
     results = []
 
-    for n, data in ranked[:count]:
+    for n, score, conf, explanation in zip(
+        (top + min_number).tolist(),
+        top_scores.tolist(),
+        confidences[top].tolist(),
+        explanations,
+    ):
         results.append({
             "number": n,
-            "score": data["score"],
-            "confidence": round(data["confidence"] * 100, 2),
-            "explanation": _explain_number(data),
+            "score": score,
+            "confidence": round(conf * 100, 2),
+            "explanation": explanation,
         })
 
     return results
 
 
-def _explain_number(data: Dict[str, float]) -> str:
+# Score bounds between explanation buckets, and the buckets in ascending order.
+# Negative bounds belong to the bucket above them, positive bounds to the one below.
+_EXPLANATION_BOUNDS = np.array([-0.5, -0.2, 0.0, 0.2, 0.5])
+_EXPLANATIONS = (
+    "Strong negative bias recently",
+    "Moderate negative trend",
+    "Neutral / mixed signals",
+    "Slight positive bias",
+    "Moderate positive trend detected",
+    "Strong positive bias across signals",
+)
+
+
+def _explain_scores(scores: np.ndarray) -> List[str]:
     """
-    Generate a short explanation for a number.
+    Generate a short explanation for each score via a bucket lookup.
     """
-    score = data["score"]
-
-    if score > 0.5:
-        return "Strong positive bias across signals"
-    elif score > 0.2:
-        return "Moderate positive trend detected"
-    elif score > 0:
-        return "Slight positive bias"
-    elif score < -0.5:
-        return "Strong negative bias recently"
-    elif score < -0.2:
-        return "Moderate negative trend"
-    else:
-        return "Neutral / mixed signals"
+    buckets = np.where(
+        scores < 0,
+        np.searchsorted(_EXPLANATION_BOUNDS, scores, side="right"),
+        np.searchsorted(_EXPLANATION_BOUNDS, scores, side="left"),
+    )
+    return [_EXPLANATIONS[b] for b in buckets]
@@ -5,21 +5,166 @@ This module contains lottery-agnostic bias signals that operate
 on validated historical draw data.
 
 Each signal returns a per-number score and does NOT make decisions.
+Scores are returned as a float32 NumPy array aligned so that index
+``i`` holds the score for number ``min_number + i``. Every call returns
+a fresh, writable array owned by the caller, including results served
+from a cache.
+
+The frequency signals raise ValueError when their window holds no draws,
+since a deviation from an empty sample is undefined. The gap signal has
+no such case and scores an empty history as all zeros.
 """
 
-from collections import Counter
-from typing import Dict
+import weakref
+from collections import OrderedDict, deque
+from typing import Dict, List, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from src.accel import HAVE_NUMBA, HAVE_NUMEXPR, NUMEXPR_MIN_SIZE, njit, numexpr, prange
 from src.config import SHORT_TERM_WINDOW
+from src.data_loader import get_draws_matrix
+
+
+# Memoized long-term scores: (id(df), len(df), min, max) -> (weakref to df, scores)
+_LONG_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_LONG_CACHE_SIZE = 32
+
+
+def compute_all_signals(
+    df: pd.DataFrame,
+    min_number: int,
+    max_number: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the short-term, long-term and hot/cold signals together.
+
+    With Numba available, the counts behind all three signals come from a
+    single compiled pass over the draws matrix; otherwise each signal
+    function is called in turn. Results are identical either way.
+
+    Parameters:
+        df (pd.DataFrame): Validated draw data (single lottery)
+        min_number (int): Minimum valid number
+        max_number (int): Maximum valid number
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (short_term, long_term, hot_cold)
+    """
+    if not HAVE_NUMBA:
+        return (
+            short_term_trend_signal(df, min_number, max_number),
+            long_term_trend_signal(df, min_number, max_number),
+            hot_cold_gap_signal(df, min_number, max_number),
+        )
+
+    draws = get_draws_matrix(df)
+    total_draws, numbers_per_draw = draws.shape
+    short_draws = min(total_draws, SHORT_TERM_WINDOW)
+
+    short_counts, long_counts, last_seen = scan_draws(
+        draws, min_number, max_number - min_number + 1, SHORT_TERM_WINDOW
+    )
+
+    return (
+        _deviation_from_counts(short_counts, short_draws * numbers_per_draw, "short-term"),
+        _deviation_from_counts(long_counts, total_draws * numbers_per_draw, "long-term"),
+        _gap_scores(last_seen, total_draws),
+    )
+
+
+
+def compute_signals_batch(
+    draws_list: Sequence[np.ndarray],
+    min_numbers: Sequence[int],
+    max_numbers: Sequence[int],
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    compute_all_signals over many draws matrices at once (e.g. one per
+    lottery, or one per historical slice in a backtest).
+
+    With Numba available, the scans run in parallel across matrices;
+    otherwise each matrix is processed in turn with NumPy.
+
+    Parameters:
+        draws_list (Sequence[np.ndarray]): (n_draws, numbers_per_draw) int matrices
+        min_numbers (Sequence[int]): Minimum valid number for each matrix
+        max_numbers (Sequence[int]): Maximum valid number for each matrix
+
+    Returns:
+        List[tuple]: (short_term, long_term, hot_cold) for each matrix
+    """
+    if not len(draws_list) == len(min_numbers) == len(max_numbers):
+        raise ValueError(
+            f"Batch lengths differ: {len(draws_list)} draws matrices, "
+            f"{len(min_numbers)} min_numbers, {len(max_numbers)} max_numbers"
+        )
+
+    draws_list = [np.asarray(draws) for draws in draws_list]
+
+    # Raw matrices are not validated upstream; out-of-range numbers would
+    # be skipped by the compiled scan but wrap around in the NumPy path, and
+    # float matrices would be truncated by one and rejected by the other
+    for b, (draws, min_number, max_number) in enumerate(zip(draws_list, min_numbers, max_numbers)):
+        if draws.ndim != 2:
+            raise ValueError(f"Batch item {b}: Expected a 2-D draws matrix, got shape {draws.shape}")
+        if not np.issubdtype(draws.dtype, np.integer):
+            raise ValueError(f"Batch item {b}: Expected an integer draws matrix, got dtype {draws.dtype}")
+        if not draws.size:
+            raise ValueError(f"Batch item {b}: No draws to score, got shape {draws.shape}")
+        smallest, largest = draws.min(), draws.max()
+        if smallest < min_number or largest > max_number:
+            n = smallest if smallest < min_number else largest
+            raise ValueError(
+                f"Batch item {b}: Number {n} out of range ({min_number}–{max_number})"
+            )
+
+    if not HAVE_NUMBA:
+        return [
+            _signals_from_matrix(draws, min_number, max_number)
+            for draws, min_number, max_number in zip(draws_list, min_numbers, max_numbers)
+        ]
+
+    short_window = SHORT_TERM_WINDOW
+    shapes = np.array([draws.shape for draws in draws_list], dtype=np.int64).reshape(-1, 2)
+    mins = np.asarray(min_numbers, dtype=np.int64)
+    range_sizes = np.asarray(max_numbers, dtype=np.int64) - mins + 1
+
+    # All matrices share one flat buffer, and per-number outputs are
+    # concatenated, so each parallel scan writes a disjoint slice
+    cell_offsets = np.concatenate(([0], np.cumsum(shapes[:, 0] * shapes[:, 1])))
+    out_offsets = np.concatenate(([0], np.cumsum(range_sizes)))
+    draws_flat = np.concatenate([draws.ravel() for draws in draws_list] + [np.empty(0, np.int64)])
+
+    short_counts, long_counts, last_seen = _scan_batch(
+        draws_flat.astype(np.int64, copy=False),
+        cell_offsets,
+        shapes,
+        mins,
+        out_offsets,
+        short_window,
+    )
+
+    results = []
+    for b, (total_draws, numbers_per_draw) in enumerate(shapes.tolist()):
+        lo, hi = out_offsets[b], out_offsets[b + 1]
+        short_draws = min(total_draws, short_window)
+        results.append((
+            _deviation_from_counts(short_counts[lo:hi], short_draws * numbers_per_draw, "short-term"),
+            _deviation_from_counts(long_counts[lo:hi], total_draws * numbers_per_draw, "long-term"),
+            _gap_scores(last_seen[lo:hi], total_draws),
+        ))
+
+    return results
+
 
 
 def short_term_trend_signal(
     df: pd.DataFrame,
     min_number: int,
     max_number: int,
-) -> Dict[int, float]:
+) -> np.ndarray:
     """
     Compute short-term frequency deviation for each number.
 
@@ -29,32 +174,65 @@ def short_term_trend_signal(
         max_number (int): Maximum valid number
 
     Returns:
-        Dict[int, float]: Per-number short-term bias scores
+        np.ndarray: Per-number short-term bias scores
     """
     # Use most recent draws only
-    recent_df = df.tail(SHORT_TERM_WINDOW)
+    recent = get_draws_matrix(df)[-SHORT_TERM_WINDOW:]
 
-    # Count number occurrences
-    counts = Counter()
-    for numbers in recent_df["numbers"]:
-        counts.update(numbers)
+    return _frequency_deviation(recent, min_number, max_number, "short-term")
 
-    total_draws = len(recent_df)
-    numbers_per_draw = len(recent_df.iloc[0]["numbers"])
 
-    # Expected frequency under uniform randomness
-    expected = (total_draws * numbers_per_draw) / (
-        max_number - min_number + 1
-    )
 
-    scores = {}
+class ShortTermTracker:
+    """
+    Incremental short_term_trend_signal for histories that grow one draw
+    at a time.
+
+    Keeps the per-number counts of the last `window` draws, plus a ring of
+    each draw's own counts so the draw leaving the window can be
+    subtracted. push() is O(numbers_per_draw + range) instead of
+    recounting the whole window.
+    """
 
-    for n in range(min_number, max_number + 1):
-        observed = counts.get(n, 0)
-        # Normalized deviation
-        scores[n] = (observed - expected) / expected
+    def __init__(self, min_number: int, max_number: int, window: int = SHORT_TERM_WINDOW):
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
 
-    return scores
+        self.min_number = min_number
+        self.max_number = max_number
+        self.window = window
+        self.counts = np.zeros(max_number - min_number + 1, dtype=np.int64)
+        self.picks = 0
+        self.ring: deque = deque()
+
+    def push(self, draw_numbers) -> None:
+        """Add the newest draw, dropping the oldest once the window is full."""
+        draw = np.asarray(draw_numbers, dtype=np.int64)
+        if draw.size and (draw.min() < self.min_number or draw.max() > self.max_number):
+            raise ValueError(
+                f"Draw {draw.tolist()} out of range ({self.min_number}–{self.max_number})"
+            )
+
+        new = np.bincount(draw - self.min_number, minlength=len(self.counts))
+        self.counts += new
+        self.picks += draw.size
+        self.ring.append(new)
+
+        if len(self.ring) > self.window:
+            old = self.ring.popleft()
+            self.counts -= old
+            self.picks -= int(old.sum())
+
+    def scores(self) -> np.ndarray:
+        """
+        Short-term bias scores for the current window, as short_term_trend_signal.
+
+        Raises ValueError until a non-empty draw has been pushed.
+        """
+        if not self.picks:
+            raise ValueError("ShortTermTracker window is empty; push() a draw before scoring")
+
+        return _deviation_from_counts(self.counts, self.picks, "short-term")
 
 
 
@@ -62,7 +240,7 @@ def long_term_trend_signal(
     df: pd.DataFrame,
     min_number: int,
     max_number: int,
-) -> Dict[int, float]:
+) -> np.ndarray:
     """
     Compute long-term frequency deviation for each number.
 
@@ -72,34 +250,39 @@ def long_term_trend_signal(
         max_number (int): Maximum valid number
 
     Returns:
-        Dict[int, float]: Per-number long-term bias scores
-    """
-    counts = Counter()
-    for numbers in df["numbers"]:
-        counts.update(numbers)
+        np.ndarray: Per-number long-term bias scores
 
-    total_draws = len(df)
-    numbers_per_draw = len(df.iloc[0]["numbers"])
+    Results are memoized per DataFrame object and length, since history
+    is append-only between draws. Mutating df in place without changing
+    its length leaves a stale entry; call long_term_trend_signal.cache_clear()
+    after doing so.
+    """
+    key = (id(df), len(df), min_number, max_number)
 
-    expected = (total_draws * numbers_per_draw) / (
-        max_number - min_number + 1
-    )
+    cached = _LONG_CACHE.get(key)
+    if cached is not None and cached[0]() is df:
+        _LONG_CACHE.move_to_end(key)
+        return cached[1].copy()
 
-    scores = {}
+    scores = _frequency_deviation(get_draws_matrix(df), min_number, max_number, "long-term")
 
-    for n in range(min_number, max_number + 1):
-        observed = counts.get(n, 0)
-        scores[n] = (observed - expected) / expected
+    # The cache keeps its own copy, so callers may modify what they get
+    _LONG_CACHE[key] = (weakref.ref(df), scores.copy())
+    if len(_LONG_CACHE) > _LONG_CACHE_SIZE:
+        _LONG_CACHE.popitem(last=False)
 
     return scores
 
 
+long_term_trend_signal.cache_clear = _LONG_CACHE.clear
+
+
 
 def hot_cold_gap_signal(
     df: pd.DataFrame,
     min_number: int,
     max_number: int,
-) -> Dict[int, float]:
+) -> np.ndarray:
     """
     Compute hot/cold gap-based signal for each number.
 
@@ -109,29 +292,181 @@ def hot_cold_gap_signal(
         max_number (int): Maximum valid number
 
     Returns:
-        Dict[int, float]: Per-number gap-based scores (0–1)
+        np.ndarray: Per-number gap-based scores (0–1)
+    """
+    return _hot_cold_from_matrix(get_draws_matrix(df), min_number, max_number)
+
+
+
+def _signals_from_matrix(
+    draws: np.ndarray,
+    min_number: int,
+    max_number: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """NumPy (short_term, long_term, hot_cold) for one draws matrix."""
+    return (
+        _frequency_deviation(draws[-SHORT_TERM_WINDOW:], min_number, max_number, "short-term"),
+        _frequency_deviation(draws, min_number, max_number, "long-term"),
+        _hot_cold_from_matrix(draws, min_number, max_number),
+    )
+
+
+
+def _hot_cold_from_matrix(draws: np.ndarray, min_number: int, max_number: int) -> np.ndarray:
+    """hot_cold_gap_signal over an (n_draws, numbers_per_draw) draws matrix."""
+    total_draws, numbers_per_draw = draws.shape
+
+    # Draw index of each number's latest appearance (-1 = never seen).
+    # A scatter-max keeps the latest index without relying on the write
+    # order of repeated indices in fancy assignment.
+    last_seen = np.full(max_number - min_number + 1, -1, dtype=np.int32)
+    draw_idx = np.repeat(np.arange(total_draws, dtype=np.int32), numbers_per_draw)
+    np.maximum.at(last_seen, draws.ravel() - min_number, draw_idx)
+
+    return _gap_scores(last_seen, total_draws)
+
+
+
+def scores_to_dict(scores: np.ndarray, min_number: int) -> Dict[int, float]:
     """
-    total_draws = len(df)
-    last_seen = {}
+    Convert a signal array into a {number: score} dict.
 
-    # Iterate in order so later draws overwrite earlier ones
-    for idx, numbers in enumerate(df["numbers"]):
-        for n in numbers:
-            last_seen[n] = idx
+    Only for callers that need per-number lookups; the signals and the
+    combiner work on the arrays directly.
+    """
+    return dict(zip(range(min_number, min_number + len(scores)), scores.tolist()))
 
-    # Compute gaps
-    gaps = {}
-    for n in range(min_number, max_number + 1):
-        if n in last_seen:
-            gap = total_draws - last_seen[n] - 1
-        else:
-            gap = total_draws  # never seen → max gap
 
-        gaps[n] = gap
 
-    max_gap = max(gaps.values()) or 1
+def _gap_scores(last_seen: np.ndarray, total_draws: int) -> np.ndarray:
+    """
+    Normalized draws-since-last-seen per number, from last-seen draw
+    indices where -1 marks a number that was never drawn.
+    """
+    # Compute gaps; the -1 sentinel makes a never-seen number's gap
+    # total_draws (the max gap) without a separate branch
+    gaps = total_draws - 1 - last_seen
 
-    # Normalize gaps to 0–1
-    scores = {n: gaps[n] / max_gap for n in gaps}
+    max_gap = int(gaps.max())
+    inv_max_gap = np.float32(1.0 / max_gap if max_gap else 1.0)
 
-    return scores
+    # Normalize gaps to 0–1 (float32 is ample for a 0–1 score)
+    return gaps.astype(np.float32) * inv_max_gap
+
+
+
+def _frequency_deviation(
+    draws: np.ndarray,
+    min_number: int,
+    max_number: int,
+    window: str,
+) -> np.ndarray:
+    """
+    Normalized deviation of observed counts from the uniform expectation.
+
+    draws is an (n_draws, numbers_per_draw) matrix, counted with a single
+    bincount over its flattened values.
+    """
+    counts = np.bincount(draws.ravel(), minlength=max_number + 1)[min_number:max_number + 1]
+
+    return _deviation_from_counts(counts, draws.size, window)
+
+
+
+def _deviation_from_counts(counts: np.ndarray, total_picks: int, window: str) -> np.ndarray:
+    """
+    Normalized deviation of per-number counts from the uniform expectation,
+    where total_picks is the number of numbers drawn in the counted window.
+
+    Raises ValueError when the window is empty, naming it in the message;
+    the expectation would otherwise be a division by zero.
+    """
+    if not total_picks:
+        raise ValueError(f"No draws in the {window} window to score")
+
+    # Expected frequency under uniform randomness;
+    # (observed - expected) / expected == observed * (1 / expected) - 1
+    inv_expected = np.float32(len(counts)) / np.float32(total_picks)
+    observed = counts.astype(np.float32)
+
+    # Wide ranges: fuse the multiply-subtract without temporaries
+    if HAVE_NUMEXPR and observed.size > NUMEXPR_MIN_SIZE:
+        return numexpr.evaluate("observed * inv_expected - 1", out=observed)
+
+    # Reuse the float32 copy as the output
+    observed *= inv_expected
+    observed -= 1
+    return observed
+
+
+
+@njit(cache=True, boundscheck=False)
+def scan_draws(draws, min_number, range_size, short_window):
+    """
+    Single pass over an (n_draws, numbers_per_draw) draws matrix.
+
+    Returns (short_counts, long_counts, last_seen) indexed by
+    number - min_number: counts over the last short_window draws, counts
+    over all draws, and the index of each number's latest draw (-1 = never
+    seen). Numbers outside the range are ignored.
+
+    Shared by the signals and line mode's fused weight kernel. It is only
+    fast when compiled, so callers check HAVE_NUMBA first.
+    """
+    short_counts = np.zeros(range_size, dtype=np.int64)
+    long_counts = np.zeros(range_size, dtype=np.int64)
+    last_seen = np.full(range_size, -1, dtype=np.int64)
+
+    _scan_into(draws, min_number, short_window, short_counts, long_counts, last_seen)
+
+    return short_counts, long_counts, last_seen
+
+
+
+@njit(cache=True, parallel=True)
+def _scan_batch(draws_flat, cell_offsets, shapes, min_numbers, out_offsets, short_window):
+    """
+    scan_draws for many flattened draws matrices in parallel.
+
+    Matrix b occupies draws_flat[cell_offsets[b]:cell_offsets[b + 1]] with
+    shape shapes[b]; its outputs are out_offsets[b]:out_offsets[b + 1] of
+    the returned arrays, so threads never write to the same slice.
+    """
+    total = out_offsets[-1]
+    short_counts = np.zeros(total, dtype=np.int64)
+    long_counts = np.zeros(total, dtype=np.int64)
+    last_seen = np.full(total, -1, dtype=np.int64)
+
+    for b in prange(shapes.shape[0]):
+        draws = draws_flat[cell_offsets[b]:cell_offsets[b + 1]].reshape((shapes[b, 0], shapes[b, 1]))
+        lo = out_offsets[b]
+        hi = out_offsets[b + 1]
+        _scan_into(
+            draws,
+            min_numbers[b],
+            short_window,
+            short_counts[lo:hi],
+            long_counts[lo:hi],
+            last_seen[lo:hi],
+        )
+
+    return short_counts, long_counts, last_seen
+
+
+
+@njit(cache=True, boundscheck=False)
+def _scan_into(draws, min_number, short_window, short_counts, long_counts, last_seen):
+    """Body of scan_draws, accumulating into zeroed / -1-filled output arrays."""
+    range_size = short_counts.shape[0]
+    n_draws, k = draws.shape
+    short_start = max(n_draws - short_window, 0)
+
+    for i in range(n_draws):
+        for j in range(k):
+            v = draws[i, j] - min_number
+            if v < 0 or v >= range_size:
+                continue
+            long_counts[v] += 1
+            if i >= short_start:
+                short_counts[v] += 1
+            last_seen[v] = i